@@ -0,0 +1,262 @@
+'''Corpus de partidas grabadas en formato columnar.
+
+Guarda muchas partidas en una carpeta con un archivo por columna:
+
+- turnos.bin: pares (valor_dado, indice) de todas las partidas,
+  concatenados como enteros de un byte con signo.
+- partidas.bin: desplazamiento (en turnos) donde empieza cada partida,
+  más uno final, como enteros de 8 bytes.
+- jugadores.bin: desplazamiento donde empiezan los jugadores de cada
+  partida, igual que partidas.bin.
+- colores.bin y computadoras.bin: un byte por jugador con el índice
+  del color en Tablero.ORDEN_COLORES y si es la computadora.
+- nombres.bin y nombres_desplazamientos.bin: nombres de los jugadores
+  en UTF-8 y dónde empieza cada uno.
+
+Los archivos se leen con mmap, de modo que leer una partida no copia
+ni carga el resto del corpus. Al agregar partidas las tablas de
+desplazamientos se escriben al final, así una interrupción nunca
+deja a la vista una partida incompleta.
+'''
+import mmap
+import os
+from array import array
+from itertools import islice
+
+from ludo.grabadora import RegistroDeJuego
+from ludo.juego import Tablero
+
+TURNOS = "turnos.bin"
+PARTIDAS = "partidas.bin"
+JUGADORES = "jugadores.bin"
+COLORES = "colores.bin"
+COMPUTADORAS = "computadoras.bin"
+NOMBRES = "nombres.bin"
+NOMBRES_DESPLAZAMIENTOS = "nombres_desplazamientos.bin"
+
+# Archivos de datos, y al final las tablas de desplazamientos
+COLUMNAS = {
+    TURNOS: "b",
+    COLORES: "B",
+    COMPUTADORAS: "B",
+    NOMBRES: "B",
+    NOMBRES_DESPLAZAMIENTOS: "q",
+    JUGADORES: "q",
+    PARTIDAS: "q",
+}
+TABLAS_DESPLAZAMIENTOS = (NOMBRES_DESPLAZAMIENTOS, JUGADORES, PARTIDAS)
+
+
+def es_corpus(directorio):
+    '''Devuelve True si la carpeta contiene un corpus'''
+    return os.path.isfile(os.path.join(directorio, PARTIDAS))
+
+
+def listar_grabaciones(entradas):
+    '''Expande las carpetas en las partidas grabadas que contienen,
+    sin los archivos temporales ni las columnas de un corpus'''
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            for nombre in sorted(os.listdir(entrada)):
+                ruta = os.path.join(entrada, nombre)
+                if os.path.isfile(ruta) and not nombre.endswith(".tmp") \
+                        and nombre not in COLUMNAS:
+                    yield ruta
+        else:
+            yield entrada
+
+
+class RegistroDelCorpus(RegistroDeJuego):
+    '''RegistroDeJuego de una partida del corpus.
+    Los turnos se leen directamente del archivo mapeado.
+    '''
+
+    def __init__(self, jugadores, turnos):
+        self.archivo_obj = None
+        self.jugadores = jugadores
+        self.turnos = turnos
+
+    @property
+    def historial_del_juego(self):
+        return list(self)
+
+    def __len__(self):
+        return len(self.turnos) // 2
+
+    def __iter__(self):
+        return zip(self.turnos[0::2], self.turnos[1::2])
+
+
+class Corpus():
+    '''Colección de partidas en una carpeta.
+    Se puede indexar con un número o un slice, y agregar partidas
+    de la grabadora con agregar.
+    Abre un corpus existente; para uno nuevo se usa Corpus.crear.
+    '''
+
+    def __init__(self, directorio):
+        self.directorio = directorio
+        if not es_corpus(directorio):
+            raise FileNotFoundError(
+                "{} no es un corpus: falta {}".format(directorio, PARTIDAS))
+        self._mapas = {}
+        self._columnas = {}
+
+    @classmethod
+    def crear(cls, directorio):
+        '''Crea la carpeta y las tablas vacías si no existen
+        y devuelve el corpus abierto'''
+        os.makedirs(directorio, exist_ok=True)
+        for nombre in TABLAS_DESPLAZAMIENTOS:
+            ruta = os.path.join(directorio, nombre)
+            if not os.path.exists(ruta):
+                with open(ruta, "wb") as archivo:
+                    array("q", [0]).tofile(archivo)
+        return cls(directorio)
+
+    def _ruta(self, nombre):
+        return os.path.join(self.directorio, nombre)
+
+    def _columna(self, nombre):
+        '''Devuelve la columna como memoryview sobre el archivo mapeado'''
+        if nombre not in self._columnas:
+            with open(self._ruta(nombre), "rb") as archivo:
+                tamano = os.fstat(archivo.fileno()).st_size
+                # Se ignora un último elemento escrito a medias
+                tamano -= tamano % array(COLUMNAS[nombre]).itemsize
+                if tamano == 0:
+                    self._columnas[nombre] = memoryview(
+                        array(COLUMNAS[nombre]))
+                    return self._columnas[nombre]
+                mapa = mmap.mmap(archivo.fileno(), tamano,
+                                 access=mmap.ACCESS_READ)
+            self._mapas[nombre] = mapa
+            self._columnas[nombre] = memoryview(mapa).cast(COLUMNAS[nombre])
+        return self._columnas[nombre]
+
+    def cerrar(self):
+        '''Libera los archivos mapeados.
+        Las partidas leídas antes siguen siendo válidas.'''
+        for columna in self._columnas.values():
+            columna.release()
+        for mapa in self._mapas.values():
+            try:
+                mapa.close()
+            except BufferError:
+                # Aún hay partidas leídas que usan el mapa,
+                # se libera cuando dejen de usarse
+                pass
+        self._columnas = {}
+        self._mapas = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+    def __len__(self):
+        return len(self._columna(PARTIDAS)) - 1
+
+    def obtener_jugadores(self, numero):
+        '''Lista de (color, nombre, es_computadora) como en la grabadora'''
+        jugadores = self._columna(JUGADORES)
+        colores = self._columna(COLORES)
+        computadoras = self._columna(COMPUTADORAS)
+        nombres = self._columna(NOMBRES)
+        desplazamientos = self._columna(NOMBRES_DESPLAZAMIENTOS)
+        res = []
+        for i in range(jugadores[numero], jugadores[numero + 1]):
+            nombre = nombres[desplazamientos[i]:desplazamientos[i + 1]]
+            res.append((Tablero.ORDEN_COLORES[colores[i]],
+                        bytes(nombre).decode("utf-8"),
+                        bool(computadoras[i])))
+        return res
+
+    def obtener_turnos(self, numero):
+        '''memoryview con valor_dado e indice intercalados'''
+        partidas = self._columna(PARTIDAS)
+        inicio, fin = partidas[numero], partidas[numero + 1]
+        return self._columna(TURNOS)[2 * inicio:2 * fin]
+
+    def __getitem__(self, numero):
+        if isinstance(numero, slice):
+            return (self[n] for n in range(*numero.indices(len(self))))
+        if numero < 0:
+            numero += len(self)
+        if not 0 <= numero < len(self):
+            raise IndexError("partida fuera del corpus")
+        return RegistroDelCorpus(self.obtener_jugadores(numero),
+                                 self.obtener_turnos(numero))
+
+    def __iter__(self):
+        for numero in range(len(self)):
+            yield self[numero]
+
+    def _descartar_incompletas(self):
+        '''Recorta los datos que dejó una escritura interrumpida
+        más allá de lo que indican las tablas de desplazamientos'''
+        partidas = self._columna(PARTIDAS)
+        jugadores = self._columna(JUGADORES)
+        cantidad_jugadores = jugadores[len(partidas) - 1]
+        cantidad_bytes_nombres = \
+            self._columna(NOMBRES_DESPLAZAMIENTOS)[cantidad_jugadores]
+        tamanos = {
+            TURNOS: 2 * partidas[-1],
+            COLORES: cantidad_jugadores,
+            COMPUTADORAS: cantidad_jugadores,
+            NOMBRES: cantidad_bytes_nombres,
+            NOMBRES_DESPLAZAMIENTOS: 8 * (cantidad_jugadores + 1),
+            JUGADORES: 8 * len(partidas),
+            PARTIDAS: 8 * len(partidas),
+        }
+        self.cerrar()
+        for nombre, tamano in tamanos.items():
+            ruta = self._ruta(nombre)
+            if os.path.exists(ruta) and os.path.getsize(ruta) > tamano:
+                os.truncate(ruta, tamano)
+
+    def agregar(self, registros):
+        '''Agrega al final del corpus una o varias partidas.
+        Acepta objetos RegistroDeJuego o CrearRegistro.'''
+        if hasattr(registros, "historial_del_juego"):
+            registros = [registros]
+        self._descartar_incompletas()
+        partidas = self._columna(PARTIDAS)
+        jugadores = self._columna(JUGADORES)
+        desplazamientos = self._columna(NOMBRES_DESPLAZAMIENTOS)
+        nuevas = {nombre: array(tipo) for nombre, tipo in COLUMNAS.items()}
+        fin_turnos = partidas[-1]
+        fin_jugadores = jugadores[-1]
+        fin_nombres = desplazamientos[-1]
+        for registro in registros:
+            for valor_dado, indice in registro.historial_del_juego:
+                nuevas[TURNOS].extend((valor_dado, indice))
+                fin_turnos += 1
+            for color, nombre, es_computadora in registro.jugadores:
+                nombre = (nombre or "").encode("utf-8")
+                nuevas[COLORES].append(Tablero.ORDEN_COLORES.index(color))
+                nuevas[COMPUTADORAS].append(int(es_computadora))
+                nuevas[NOMBRES].frombytes(nombre)
+                fin_nombres += len(nombre)
+                nuevas[NOMBRES_DESPLAZAMIENTOS].append(fin_nombres)
+                fin_jugadores += 1
+            nuevas[JUGADORES].append(fin_jugadores)
+            nuevas[PARTIDAS].append(fin_turnos)
+        self.cerrar()
+        # El orden de COLUMNAS deja las tablas de desplazamientos al final
+        for nombre, datos in nuevas.items():
+            with open(self._ruta(nombre), "ab") as archivo:
+                datos.tofile(archivo)
+
+    def importar(self, rutas, tamano_lote=1000):
+        '''Agrega al corpus las partidas guardadas por la grabadora'''
+        rutas = iter(rutas)
+        while True:
+            lote = []
+            for ruta in islice(rutas, tamano_lote):
+                with open(ruta, "rb") as archivo:
+                    lote.append(RegistroDeJuego(archivo))
+            if not lote:
+                break
+            self.agregar(lote)
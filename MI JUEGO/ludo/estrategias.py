@@ -0,0 +1,42 @@
+'''Estrategias de la computadora para elegir ficha.
+
+Cada estrategia recibe el juego y devuelve una función invocable
+sin argumentos, que se usa como elegir_ficha_delegate del Jugador.
+Al ser llamada consulta juego.fichas_movibles y devuelve el índice elegido.
+'''
+import random
+
+from ludo.heuristica import estrategia_heuristica
+
+
+def estrategia_aleatoria(juego):
+    '''Elige cualquier ficha permitida, igual que la computadora.'''
+    def elegir():
+        return random.randint(0, len(juego.fichas_movibles) - 1)
+    return elegir
+
+
+def estrategia_mas_adelantada(juego):
+    '''Mueve la ficha a la que le faltan menos casillas para terminar.'''
+    def elegir():
+        distancias = [juego.tablero.distancia_al_final(ficha)
+                      for ficha in juego.fichas_movibles]
+        return distancias.index(min(distancias))
+    return elegir
+
+
+def estrategia_mas_atrasada(juego):
+    '''Mueve la ficha a la que le faltan más casillas para terminar.'''
+    def elegir():
+        distancias = [juego.tablero.distancia_al_final(ficha)
+                      for ficha in juego.fichas_movibles]
+        return distancias.index(max(distancias))
+    return elegir
+
+
+ESTRATEGIAS = {
+    'aleatoria': estrategia_aleatoria,
+    'adelantada': estrategia_mas_adelantada,
+    'atrasada': estrategia_mas_atrasada,
+    'heuristica': estrategia_heuristica,
+}
@@ -0,0 +1,206 @@
+'''Exporta los turnos de las partidas como filas de eventos.
+
+Cada fila describe un turno ya resuelto: quién jugó, el dado,
+la ficha movida, desde dónde y hasta dónde, qué fichas capturó
+y el color de quienes entraron a la clasificación (los nombres se
+repiten, todas las computadoras se llaman igual). Las filas se generan
+una a una, reproduciendo grabaciones o jugando partidas en vivo, y se
+escriben por lotes en JSON Lines o Arrow, así que la memoria usada no
+depende del tamaño del corpus.
+
+Cada turno grabado se comprueba con Juego.validar_turno antes de
+reproducirlo. Si una grabación está dañada se avisa del archivo y el
+turno, y la exportación sigue con la siguiente partida.
+'''
+import argparse
+import json
+import os
+import sys
+from itertools import islice
+
+from ludo.corpus import Corpus, es_corpus, listar_grabaciones
+from ludo.grabadora import RegistroDeJuego
+from ludo.validador import validar_jugadores
+
+
+def jugar_turno_descrito(juego, partida, turno, indice=None,
+                         valor_dado=None):
+    '''Juega un turno con Juego.jugar_turno y devuelve su fila.
+    indice y valor_dado se pasan igual que en jugar_turno.'''
+    ya_clasificados = len(juego.clasificacion)
+    posiciones = dict(juego.tablero.posiciones_fichas)
+    juego.jugar_turno(indice, valor_dado)
+    ficha = juego.ficha_elegida
+    desde = hasta = (None, None)
+    if ficha is not None:
+        desde = posiciones[ficha]
+        hasta = juego.tablero.posiciones_fichas[ficha]
+    return {
+        "partida": str(partida),
+        "turno": turno,
+        "jugador": juego.jugador_actual.nombre,
+        "color": juego.jugador_actual.color,
+        "dado": juego.valor_dado,
+        "indice": juego.indice,
+        "fichas_movibles": [f.id for f in juego.fichas_movibles],
+        "ficha": None if ficha is None else ficha.id,
+        "desde_comun": desde[0],
+        "desde_privada": desde[1],
+        "hasta_comun": hasta[0],
+        "hasta_privada": hasta[1],
+        "capturadas": [f.id for f in juego.fichas_expulsadas],
+        "llego_al_final": ficha is not None and
+        juego.tablero.ficha_llego_al_final(ficha),
+        "clasificados": [jugador.color for jugador
+                         in juego.clasificacion[ya_clasificados:]],
+    }
+
+
+def avisar_error(partida, turno, mensaje):
+    '''Avisa por la salida de errores de una partida que no se exportó
+    completa. turno es None si el problema está en el archivo.'''
+    donde = "archivo" if turno is None else "turno {}".format(turno)
+    print("{}: {}: {}".format(partida, donde, mensaje), file=sys.stderr)
+
+
+def filas_de_registro(registro, partida=0, al_encontrar_error=avisar_error):
+    '''Reproduce una partida grabada y genera una fila por turno.
+    Al primer turno que no sea válido se llama a al_encontrar_error
+    con la partida, el turno y el mensaje, y la partida termina ahí.'''
+    error = validar_jugadores(registro.jugadores)
+    if error:
+        al_encontrar_error(partida, None, error)
+        return
+    juego = registro.crear_juego()
+    for turno, datos_turno in enumerate(registro):
+        try:
+            valor_dado, indice = datos_turno
+        except (TypeError, ValueError):
+            error = "Turno mal formado: {!r}".format(datos_turno)
+        else:
+            error = juego.validar_turno(indice, valor_dado)
+        if error:
+            al_encontrar_error(partida, turno, error)
+            return
+        yield jugar_turno_descrito(juego, partida, turno, indice,
+                                   valor_dado)
+
+
+def filas_de_registros(registros, nombre=None,
+                       al_encontrar_error=avisar_error):
+    '''Filas de varias partidas grabadas, por ejemplo un Corpus.
+    La partida de cada fila es su número, precedido de nombre y
+    dos puntos si se da nombre.'''
+    for numero, registro in enumerate(registros):
+        partida = numero if nombre is None else \
+            "{}:{}".format(nombre, numero)
+        yield from filas_de_registro(registro, partida, al_encontrar_error)
+
+
+def filas_de_archivos(rutas, al_encontrar_error=avisar_error):
+    '''Filas de las partidas guardadas por la grabadora.
+    La partida de cada fila es el nombre del archivo.'''
+    for ruta in rutas:
+        partida = os.path.basename(ruta)
+        try:
+            with open(ruta, "rb") as archivo:
+                registro = RegistroDeJuego(archivo)
+        except Exception as e:
+            al_encontrar_error(partida, None,
+                               "No se pudo leer: {}".format(e))
+            continue
+        yield from filas_de_registro(registro, partida, al_encontrar_error)
+
+
+def filas_en_vivo(juego, partida=0, registro=None):
+    '''Juega la partida hasta el final generando una fila por turno.
+    Si se da registro (un CrearRegistro) también se graban los turnos.'''
+    turno = 0
+    while not juego.terminado:
+        fila = jugar_turno_descrito(juego, partida, turno)
+        if registro is not None:
+            registro.agregar_turno_del_juego(juego.valor_dado, juego.indice)
+        turno += 1
+        yield fila
+
+
+def _lotes(filas, tamano_lote):
+    filas = iter(filas)
+    while True:
+        lote = list(islice(filas, tamano_lote))
+        if not lote:
+            return
+        yield lote
+
+
+def exportar_jsonl(filas, ruta, tamano_lote=10000):
+    '''Escribe las filas en JSON Lines. Devuelve cuántas escribió.'''
+    total = 0
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for lote in _lotes(filas, tamano_lote):
+            archivo.write("".join(
+                json.dumps(fila, ensure_ascii=False) + "\n"
+                for fila in lote))
+            total += len(lote)
+    return total
+
+
+def esquema_arrow():
+    import pyarrow as pa
+    texto = pa.string()
+    lista = pa.list_(texto)
+    return pa.schema([
+        ("partida", texto), ("turno", pa.int32()), ("jugador", texto),
+        ("color", texto), ("dado", pa.int8()), ("indice", pa.int8()),
+        ("fichas_movibles", lista), ("ficha", texto),
+        ("desde_comun", pa.int8()), ("desde_privada", pa.int8()),
+        ("hasta_comun", pa.int8()), ("hasta_privada", pa.int8()),
+        ("capturadas", lista), ("llego_al_final", pa.bool_()),
+        ("clasificados", lista),
+    ])
+
+
+def exportar_arrow(filas, ruta, tamano_lote=10000):
+    '''Escribe las filas en un archivo Arrow IPC, un lote
+    por record batch. Necesita pyarrow. Devuelve cuántas escribió.'''
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("Exportar a Arrow necesita el paquete pyarrow")
+    esquema = esquema_arrow()
+    total = 0
+    with pa.OSFile(ruta, "wb") as archivo, \
+            pa.ipc.new_file(archivo, esquema) as escritor:
+        for lote in _lotes(filas, tamano_lote):
+            escritor.write_batch(
+                pa.RecordBatch.from_pylist(lote, schema=esquema))
+            total += len(lote)
+    return total
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Exporta los turnos de partidas grabadas")
+    parser.add_argument("salida",
+                        help="Archivo .jsonl o .arrow a escribir")
+    parser.add_argument("entradas", nargs="+",
+                        help="Partidas grabadas, carpetas con partidas "
+                             "o carpetas de corpus")
+    parser.add_argument("--lote", type=int, default=10000)
+    argumentos = parser.parse_args()
+
+    def filas_de_entradas(entradas):
+        for entrada in entradas:
+            if os.path.isdir(entrada) and es_corpus(entrada):
+                with Corpus(entrada) as corpus:
+                    yield from filas_de_registros(corpus, entrada)
+            else:
+                yield from filas_de_archivos(listar_grabaciones([entrada]))
+
+    if argumentos.salida.endswith(".arrow"):
+        exportar = exportar_arrow
+    else:
+        exportar = exportar_jsonl
+    total = exportar(filas_de_entradas(argumentos.entradas),
+                     argumentos.salida, argumentos.lote)
+    print("{} turnos exportados".format(total))
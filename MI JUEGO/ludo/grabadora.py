@@ -1,5 +1,5 @@
 import pickle
-from ludo.juego import Jugador
+from ludo.juego import Jugador, Juego
 
 
 class RegistroDeJuego():
@@ -30,6 +30,15 @@ class RegistroDeJuego():
             res.append(jugador)
         return res
 
+    def crear_juego(self, func=None):
+        '''Devuelve un Juego nuevo con los jugadores
+        grabados, listo para reproducir el historial
+        '''
+        juego = Juego()
+        for jugador in self.obtener_jugadores(func):
+            juego.agregar_jugador(jugador)
+        return juego
+
     def obtener_historial_del_juego(self):
         return self.historial_del_juego
 
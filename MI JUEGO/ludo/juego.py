@@ -106,8 +106,8 @@ class Tablero():
         posicion_comun, posicion_privada = self.posiciones_fichas[ficha]
         return posicion_privada + valor_dado <= self.TAMANO_COLOR_TABLERO
 
-    def mover_ficha(self, ficha, valor_dado):
-        '''Cambia la posición de la ficha y verifica si ha llegado a su zona de color.'''
+    def posicion_tras_mover(self, ficha, valor_dado):
+        '''Devuelve la posición a la que llegaría la ficha, sin moverla.'''
         posicion_comun, posicion_privada = self.posiciones_fichas[ficha]
         fin = self.FIN_COLORES[ficha.color.lower()]
         if posicion_privada > 0:
@@ -119,13 +119,34 @@ class Tablero():
             posicion_comun += valor_dado
             if posicion_comun > self.TAMANO_TABLERO:
                 posicion_comun -= self.TAMANO_TABLERO
-        self.colocar_ficha(ficha, (posicion_comun, posicion_privada))
+        return posicion_comun, posicion_privada
+
+    def mover_ficha(self, ficha, valor_dado):
+        '''Cambia la posición de la ficha y verifica si ha llegado a su zona de color.'''
+        self.colocar_ficha(ficha, self.posicion_tras_mover(ficha, valor_dado))
 
     def ficha_llego_al_final(self, ficha):
         '''Devuelve True si la ficha ha alcanzado el final.'''
         _, posicion_privada = self.posiciones_fichas[ficha]
         return posicion_privada == self.TAMANO_COLOR_TABLERO
 
+    def distancia_al_final(self, ficha, posicion=None):
+        '''Devuelve cuántas casillas le faltan a la ficha para terminar.
+        Una ficha en la piscina necesita además una casilla para salir.
+        Si se da posicion se calcula desde ahí y no desde la actual.'''
+        if posicion is None:
+            posicion = self.posiciones_fichas[ficha]
+        posicion_comun, posicion_privada = posicion
+        if posicion_privada > 0:
+            return self.TAMANO_COLOR_TABLERO - posicion_privada
+        extra = 0
+        if (posicion_comun, posicion_privada) == self.posicion_piscina:
+            posicion_comun = self.INICIO_COLORES[ficha.color.lower()]
+            extra = 1
+        fin = self.FIN_COLORES[ficha.color.lower()]
+        return ((fin - posicion_comun) % self.TAMANO_TABLERO +
+                self.TAMANO_COLOR_TABLERO + extra)
+
     def obtener_fichas_misma_posicion(self, ficha):
         '''Devuelve una lista de fichas en la misma posición.'''
         posicion = self.posiciones_fichas[ficha]
@@ -161,6 +182,7 @@ class Juego():
         self.clasificacion = []
         self.tablero = Tablero()
         self.finalizado = False
+        self.terminado = False
         self.valor_dado = None
         self.jugador_actual = None
         self.fichas_movibles = []
@@ -183,6 +205,32 @@ class Juego():
         if self.valor_dado != Dado.MAX:
             self.jugadores.rotate(-1)
         return self.jugadores[0]
+
+    def ver_siguiente_jugador(self):
+        '''Devuelve el jugador del próximo turno sin cambiar el orden.'''
+        if self.valor_dado != Dado.MAX and len(self.jugadores) > 1:
+            return self.jugadores[1]
+        return self.jugadores[0]
+
+    def validar_turno(self, indice, valor_dado):
+        '''Comprueba un turno grabado antes de reproducirlo con jugar_turno.
+        Devuelve un mensaje con el problema, o None si el turno es válido.'''
+        if self.terminado:
+            return "El juego ya había terminado"
+        if type(valor_dado) is not int or \
+                not Dado.MIN <= valor_dado <= Dado.MAX:
+            return "Valor del dado no válido: {!r}".format(valor_dado)
+        fichas_movibles = self.obtener_fichas_permitidas_para_mover(
+            self.ver_siguiente_jugador(), valor_dado)
+        if not fichas_movibles:
+            if indice != -1:
+                return "Índice {!r} sin fichas para mover".format(indice)
+        elif type(indice) is not int or \
+                not 0 <= indice < len(fichas_movibles):
+            return "Índice no válido: {!r} con {} fichas para mover".format(
+                indice, len(fichas_movibles))
+        return None
+
     def obtener_ficha_de_la_piscina(self, jugador):
         '''Obtiene una ficha de la piscina del tablero cuando debe comenzar.'''
         for ficha in jugador.fichas:
@@ -240,6 +288,7 @@ class Juego():
                 if len(self.jugadores) == 1:
                     self.clasificacion.extend(self.jugadores)
                     self.terminado = True
+                    self.finalizado = True
         else:
             self.empujar_ficha_extranjera(ficha)  # Verifica si debe empujar fichas rivales
 
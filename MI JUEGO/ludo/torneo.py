@@ -0,0 +1,259 @@
+'''Torneo de todos contra todos entre estrategias de la computadora.
+
+Cada partida se juega sin interfaz en un grupo de procesos y se guarda
+con la grabadora. Las calificaciones se actualizan partida por partida,
+siempre en el orden del calendario, de modo que un torneo interrumpido
+se reanuda reproduciendo las grabaciones existentes y llega al mismo
+resultado que si se hubiera jugado de una vez.
+'''
+import argparse
+import math
+import os
+import random
+from itertools import combinations, permutations
+from multiprocessing import Pool
+
+from ludo.estrategias import ESTRATEGIAS
+from ludo.grabadora import CrearRegistro, RegistroDeJuego
+from ludo.juego import Juego, Jugador, Tablero
+
+
+class Calificaciones():
+    '''Calificaciones tipo Glicko de cada participante.
+    Cada partida es un período de calificación en el que
+    cada jugador gana contra los que quedaron detrás de él
+    en la clasificación y pierde contra los que quedaron delante.
+    '''
+
+    INICIAL = 1500.0
+    DESVIACION_INICIAL = 350.0
+    Q = math.log(10) / 400
+    # Factor para un intervalo de confianza del 95 %
+    Z = 1.96
+
+    def __init__(self, variacion=10.0):
+        '''variacion es la constante c de Glicko: cuánto crece la
+        desviación en cada partida porque la fuerza real puede cambiar.
+        Con 0 la desviación solo disminuye.'''
+        self.variacion = variacion
+        # Diccionario nombre -> (calificación, desviación)
+        self.valores = {}
+        self.partidas = {}
+
+    def obtener(self, nombre):
+        return self.valores.get(
+            nombre, (self.INICIAL, self.DESVIACION_INICIAL))
+
+    def _g(self, desviacion):
+        return 1 / math.sqrt(
+            1 + 3 * (self.Q * desviacion) ** 2 / math.pi ** 2)
+
+    def _inflar(self, nombre):
+        '''Calificación y desviación al empezar un período,
+        con la desviación aumentada según la variación'''
+        calificacion, desviacion = self.obtener(nombre)
+        desviacion = min(math.sqrt(desviacion ** 2 + self.variacion ** 2),
+                         self.DESVIACION_INICIAL)
+        return calificacion, desviacion
+
+    def actualizar(self, clasificacion):
+        '''clasificacion es la lista de nombres
+        del primer al último lugar de una partida'''
+        previos = {nombre: self._inflar(nombre) for nombre in clasificacion}
+        for puesto, nombre in enumerate(clasificacion):
+            calificacion, desviacion = previos[nombre]
+            suma_varianza = 0.0
+            suma_mejora = 0.0
+            for puesto_rival, rival in enumerate(clasificacion):
+                if rival == nombre:
+                    continue
+                calificacion_rival, desviacion_rival = previos[rival]
+                g = self._g(desviacion_rival)
+                esperado = 1 / (1 + 10 ** (
+                    -g * (calificacion - calificacion_rival) / 400))
+                resultado = 1.0 if puesto < puesto_rival else 0.0
+                suma_varianza += g * g * esperado * (1 - esperado)
+                suma_mejora += g * (resultado - esperado)
+            precision = (1 / desviacion ** 2 +
+                         self.Q ** 2 * suma_varianza)
+            calificacion += self.Q / precision * suma_mejora
+            desviacion = math.sqrt(1 / precision)
+            self.valores[nombre] = (calificacion, desviacion)
+            self.partidas[nombre] = self.partidas.get(nombre, 0) + 1
+
+    def intervalo(self, nombre):
+        '''Devuelve el intervalo de confianza de la calificación'''
+        calificacion, desviacion = self.obtener(nombre)
+        return (calificacion - self.Z * desviacion,
+                calificacion + self.Z * desviacion)
+
+    def tabla(self):
+        '''Lista de (nombre, calificación, mínimo, máximo, partidas)
+        ordenada de mejor a peor'''
+        filas = []
+        for nombre, (calificacion, _) in self.valores.items():
+            minimo, maximo = self.intervalo(nombre)
+            filas.append((nombre, calificacion, minimo, maximo,
+                          self.partidas[nombre]))
+        return sorted(filas, key=lambda fila: fila[1], reverse=True)
+
+
+def generar_asientos(participantes, jugadores_por_partida=2):
+    '''Genera las distribuciones de asientos de un todos contra todos.
+    Para cada grupo de participantes se prueban todos los órdenes de turno
+    y todas las rotaciones de Tablero.ORDEN_COLORES, así que cada
+    participante ocupa cada color y cada turno el mismo número de veces.
+    Devuelve listas de (color, nombre) en el orden en que se agregan.
+    '''
+    colores = Tablero.ORDEN_COLORES
+    paso = max(len(colores) // jugadores_por_partida, 1)
+    for grupo in combinations(participantes, jugadores_por_partida):
+        for orden in permutations(grupo):
+            for rotacion in range(len(colores)):
+                yield [(colores[(rotacion + puesto * paso) % len(colores)],
+                        nombre)
+                       for puesto, nombre in enumerate(orden)]
+
+
+def nombre_archivo_partida(numero):
+    return "partida_{:06d}.ludo".format(numero)
+
+
+def jugar_partida(asientos, estrategias, turnos=()):
+    '''Juega una partida completa sin interfaz.
+    turnos son los pares (valor_dado, indice) ya grabados: se reproducen
+    hasta el primero que no sea válido y la partida sigue desde ahí.
+    Devuelve el juego y su registro'''
+    juego = Juego()
+    registro = CrearRegistro()
+    for color, nombre in asientos:
+        jugador = Jugador(color, nombre, estrategias[nombre](juego))
+        juego.agregar_jugador(jugador)
+        registro.agregar_jugador(jugador)
+    for turno in turnos:
+        try:
+            valor_dado, indice = turno
+        except (TypeError, ValueError):
+            break
+        if juego.validar_turno(indice, valor_dado):
+            break
+        juego.jugar_turno(indice, valor_dado)
+        registro.agregar_turno_del_juego(valor_dado, indice)
+    while not juego.terminado:
+        juego.jugar_turno()
+        registro.agregar_turno_del_juego(juego.valor_dado, juego.indice)
+    return juego, registro
+
+
+def cargar_turnos_grabados(ruta, asientos):
+    '''Devuelve los turnos grabados de una partida del calendario.
+    Si el archivo no existe o no se puede leer devuelve una lista vacía
+    y la partida se juega de nuevo. Si fue grabada con otros jugadores
+    lanza ValueError, porque la carpeta es de otro calendario.'''
+    if not os.path.exists(ruta):
+        return []
+    try:
+        with open(ruta, "rb") as archivo:
+            registro = RegistroDeJuego(archivo)
+        grabados = [(color, nombre)
+                    for color, nombre, _ in registro.jugadores]
+        turnos = list(registro.historial_del_juego)
+    except Exception:
+        return []
+    if grabados != [tuple(asiento) for asiento in asientos]:
+        raise ValueError(
+            "{} fue grabada con los jugadores {} y el calendario espera {}. "
+            "Use otra carpeta para un torneo con otras opciones.".format(
+                ruta, grabados, list(asientos)))
+    return turnos
+
+
+def _ejecutar_tarea(tarea):
+    '''Trabajo de cada proceso: reproduce lo grabado de la partida,
+    la termina si estaba incompleta o dañada y la guarda.
+    Devuelve los nombres en orden de clasificación.'''
+    ruta, asientos, semilla, estrategias = tarea
+    turnos = cargar_turnos_grabados(ruta, asientos)
+    random.seed(semilla)
+    juego, registro = jugar_partida(asientos, estrategias, turnos)
+    if registro.historial_del_juego != turnos:
+        # Se escribe en un archivo temporal para que una interrupción
+        # nunca deje una grabación a medias con el nombre definitivo
+        temporal = ruta + ".tmp"
+        with open(temporal, "wb") as archivo:
+            registro.guardar(archivo)
+        os.replace(temporal, ruta)
+    return [jugador.nombre for jugador in juego.clasificacion]
+
+
+class Torneo():
+    '''Calendario de partidas entre estrategias.
+    estrategias es un diccionario nombre -> estrategia,
+    donde la estrategia recibe el juego y devuelve
+    el elegir_ficha_delegate del jugador.
+    '''
+
+    def __init__(self, estrategias, directorio, jugadores_por_partida=2,
+                 rondas=1, semilla=0, variacion=10.0):
+        self.estrategias = estrategias
+        self.directorio = directorio
+        self.jugadores_por_partida = jugadores_por_partida
+        self.rondas = rondas
+        self.semilla = semilla
+        self.calificaciones = Calificaciones(variacion)
+
+    def calendario(self):
+        '''Lista de asientos de todas las partidas del torneo'''
+        asientos = list(generar_asientos(sorted(self.estrategias),
+                                         self.jugadores_por_partida))
+        return asientos * self.rondas
+
+    def _tareas(self):
+        for numero, asientos in enumerate(self.calendario()):
+            ruta = os.path.join(self.directorio,
+                                nombre_archivo_partida(numero))
+            estrategias = {nombre: self.estrategias[nombre]
+                           for _, nombre in asientos}
+            semilla = "{}-{}".format(self.semilla, numero)
+            yield ruta, asientos, semilla, estrategias
+
+    def jugar(self, procesos=None, al_terminar_partida=None):
+        '''Juega las partidas que falten y actualiza las calificaciones.
+        al_terminar_partida es una función opcional que se llama
+        con el número de partida y la clasificación.'''
+        os.makedirs(self.directorio, exist_ok=True)
+        with Pool(procesos) as grupo:
+            resultados = grupo.imap(_ejecutar_tarea, self._tareas(),
+                                    chunksize=16)
+            for numero, clasificacion in enumerate(resultados):
+                self.calificaciones.actualizar(clasificacion)
+                if al_terminar_partida is not None:
+                    al_terminar_partida(numero, clasificacion)
+        return self.calificaciones
+
+
+def imprimir_calificaciones(calificaciones):
+    print("{:<12}{:>10}{:>20}{:>10}".format(
+        "Estrategia", "Glicko", "Intervalo 95 %", "Partidas"))
+    for nombre, calificacion, minimo, maximo, partidas in \
+            calificaciones.tabla():
+        print("{:<12}{:>10.1f}{:>20}{:>10}".format(
+            nombre, calificacion,
+            "{:.0f} - {:.0f}".format(minimo, maximo), partidas))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Torneo entre estrategias de la computadora")
+    parser.add_argument("directorio",
+                        help="Carpeta donde se guardan las partidas")
+    parser.add_argument("--jugadores", type=int, default=2,
+                        choices=(2, 3, 4))
+    parser.add_argument("--rondas", type=int, default=1)
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--semilla", type=int, default=0)
+    argumentos = parser.parse_args()
+    torneo = Torneo(ESTRATEGIAS, argumentos.directorio,
+                    argumentos.jugadores, argumentos.rondas,
+                    argumentos.semilla)
+    imprimir_calificaciones(torneo.jugar(argumentos.procesos))
@@ -0,0 +1,170 @@
+'''Valida partidas grabadas reproduciéndolas en un grupo de procesos.
+
+Cada turno se comprueba con Juego.validar_turno antes de jugarlo,
+de modo que una grabación dañada o editada a mano se detecta en el
+primer turno incorrecto en lugar de fallar a mitad de la reproducción.
+Opcionalmente el archivo se recorta hasta su último turno válido
+para que la partida se pueda continuar. Las partidas de un corpus
+también se validan, pero no se pueden recortar.
+'''
+import argparse
+import os
+from collections import namedtuple
+from itertools import chain
+from multiprocessing import Pool
+
+from ludo.corpus import Corpus, es_corpus, listar_grabaciones
+from ludo.grabadora import CrearRegistro, RegistroDeJuego
+from ludo.juego import Tablero
+
+# turno es el número del primer turno incorrecto,
+# o None si el problema está en los jugadores o en el archivo.
+# error es None si la grabación es válida.
+Resultado = namedtuple("Resultado", "ruta turno error turnos_validos reparado")
+
+# Partidas de un corpus que valida cada proceso de una vez
+TAMANO_BLOQUE_CORPUS = 256
+
+
+def validar_jugadores(jugadores):
+    '''Devuelve un mensaje si los jugadores grabados no son válidos'''
+    try:
+        colores = [color for color, _, _ in jugadores]
+    except (TypeError, ValueError):
+        return "Jugadores mal formados"
+    if not 2 <= len(colores) <= len(Tablero.ORDEN_COLORES):
+        return "Cantidad de jugadores no válida: {}".format(len(colores))
+    for color in colores:
+        if color not in Tablero.ORDEN_COLORES:
+            return "Color no válido: {!r}".format(color)
+    if len(set(colores)) != len(colores):
+        return "Colores repetidos"
+    return None
+
+
+def validar_registro(registro):
+    '''Reproduce el registro comprobando cada turno.
+    Devuelve (turno, error, turnos_validos).'''
+    error = validar_jugadores(registro.jugadores)
+    if error:
+        return None, error, 0
+    juego = registro.crear_juego()
+    for turno, datos_turno in enumerate(registro):
+        try:
+            valor_dado, indice = datos_turno
+        except (TypeError, ValueError):
+            return turno, "Turno mal formado: {!r}".format(datos_turno), turno
+        error = juego.validar_turno(indice, valor_dado)
+        if error:
+            return turno, error, turno
+        juego.jugar_turno(indice, valor_dado)
+    return None, None, len(registro.historial_del_juego)
+
+
+def recortar_registro(registro, ruta, turnos):
+    '''Sobrescribe la grabación dejando solo los primeros turnos'''
+    nuevo = CrearRegistro()
+    nuevo.jugadores = list(registro.jugadores)
+    nuevo.historial_del_juego = list(registro.historial_del_juego[:turnos])
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        nuevo.guardar(archivo)
+    os.replace(temporal, ruta)
+
+
+def validar_archivo(ruta, reparar=False):
+    '''Valida una grabación y, si reparar es True,
+    la recorta hasta su último turno válido'''
+    try:
+        with open(ruta, "rb") as archivo:
+            registro = RegistroDeJuego(archivo)
+        registro.historial_del_juego = list(registro.historial_del_juego)
+    except Exception as e:
+        return Resultado(ruta, None, "No se pudo leer: {}".format(e),
+                         0, False)
+    turno, error, turnos_validos = validar_registro(registro)
+    reparado = False
+    if reparar and turno is not None:
+        recortar_registro(registro, ruta, turnos_validos)
+        reparado = True
+    return Resultado(ruta, turno, error, turnos_validos, reparado)
+
+
+def _validar_tarea(tarea):
+    return validar_archivo(*tarea)
+
+
+def validar_archivos(rutas, reparar=False, procesos=None):
+    '''Valida las grabaciones en paralelo.
+    Genera un Resultado por archivo a medida que terminan.'''
+    tareas = ((ruta, reparar) for ruta in rutas)
+    with Pool(procesos) as grupo:
+        yield from grupo.imap_unordered(_validar_tarea, tareas,
+                                        chunksize=16)
+
+
+def _validar_bloque_corpus(tarea):
+    directorio, inicio, fin = tarea
+    resultados = []
+    with Corpus(directorio) as corpus:
+        for numero in range(inicio, fin):
+            turno, error, turnos_validos = validar_registro(corpus[numero])
+            resultados.append(Resultado(
+                "{}:{}".format(directorio, numero), turno, error,
+                turnos_validos, False))
+    return resultados
+
+
+def validar_corpus(directorio, procesos=None):
+    '''Valida en paralelo las partidas de un corpus, por bloques.
+    La ruta de cada Resultado es la carpeta y el número de partida.'''
+    with Corpus(directorio) as corpus:
+        total = len(corpus)
+    tareas = ((directorio, inicio, min(inicio + TAMANO_BLOQUE_CORPUS, total))
+              for inicio in range(0, total, TAMANO_BLOQUE_CORPUS))
+    with Pool(procesos) as grupo:
+        for resultados in grupo.imap_unordered(_validar_bloque_corpus,
+                                               tareas):
+            yield from resultados
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Valida partidas grabadas")
+    parser.add_argument("entradas", nargs="+",
+                        help="Partidas grabadas, carpetas con partidas "
+                             "o carpetas de corpus")
+    parser.add_argument("--reparar", action="store_true",
+                        help="Recorta cada partida hasta su último "
+                             "turno válido. Las partidas de un torneo "
+                             "recortadas se terminan de jugar al "
+                             "reanudarlo. Las partidas de un corpus no "
+                             "se recortan.")
+    parser.add_argument("--procesos", type=int, default=None)
+    argumentos = parser.parse_args()
+    corpus = [entrada for entrada in argumentos.entradas
+              if os.path.isdir(entrada) and es_corpus(entrada)]
+    archivos = [entrada for entrada in argumentos.entradas
+                if entrada not in corpus]
+    if argumentos.reparar and corpus:
+        print("Aviso: las partidas de un corpus solo se validan, "
+              "no se recortan")
+    resultados = chain(
+        validar_archivos(listar_grabaciones(archivos),
+                         argumentos.reparar, argumentos.procesos),
+        *[validar_corpus(directorio, argumentos.procesos)
+          for directorio in corpus])
+    total = incorrectas = 0
+    for resultado in resultados:
+        total += 1
+        if resultado.error is None:
+            continue
+        incorrectas += 1
+        donde = "archivo" if resultado.turno is None else \
+            "turno {}".format(resultado.turno)
+        mensaje = "{}: {}: {}".format(resultado.ruta, donde, resultado.error)
+        if resultado.reparado:
+            mensaje += " (recortada a {} turnos)".format(
+                resultado.turnos_validos)
+        print(mensaje)
+    print("{} partidas revisadas, {} con errores".format(total, incorrectas))
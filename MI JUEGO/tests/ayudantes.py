@@ -0,0 +1,19 @@
+import random
+
+from ludo.grabadora import CrearRegistro
+from ludo.juego import Juego, Jugador
+
+
+def grabar_partida(colores=('yellow', 'red'), semilla=0):
+    '''Juega una partida entre computadoras y devuelve su registro'''
+    random.seed(semilla)
+    juego = Juego()
+    registro = CrearRegistro()
+    for color in colores:
+        jugador = Jugador(color)
+        juego.agregar_jugador(jugador)
+        registro.agregar_jugador(jugador)
+    while not juego.terminado:
+        juego.jugar_turno()
+        registro.agregar_turno_del_juego(juego.valor_dado, juego.indice)
+    return registro
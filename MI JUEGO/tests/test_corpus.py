@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from ludo.corpus import Corpus, PARTIDAS, TURNOS
+from tests.ayudantes import grabar_partida
+
+
+class PruebasCorpus(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.directorio = os.path.join(self.carpeta.name, "corpus")
+        self.registros = [grabar_partida(semilla=semilla)
+                          for semilla in range(3)]
+
+    def tearDown(self):
+        self.carpeta.cleanup()
+
+    def comprobar_igual(self, partida, registro):
+        self.assertEqual(list(partida), registro.historial_del_juego)
+        self.assertEqual(partida.jugadores, registro.jugadores)
+
+    def test_ida_y_vuelta(self):
+        corpus = Corpus.crear(self.directorio)
+        corpus.agregar(self.registros[:2])
+        corpus.agregar(self.registros[2])
+        with Corpus(self.directorio) as corpus:
+            self.assertEqual(len(corpus), 3)
+            for partida, registro in zip(corpus, self.registros):
+                self.comprobar_igual(partida, registro)
+            self.comprobar_igual(corpus[-1], self.registros[-1])
+            self.assertEqual(len(list(corpus[1:])), 2)
+
+    def test_abrir_no_crea_archivos(self):
+        with self.assertRaises(FileNotFoundError):
+            Corpus(self.directorio)
+        self.assertFalse(os.path.exists(self.directorio))
+
+    def test_escritura_interrumpida(self):
+        corpus = Corpus.crear(self.directorio)
+        corpus.agregar(self.registros[:2])
+        corpus.cerrar()
+        # Datos y desplazamiento escritos a medias
+        with open(os.path.join(self.directorio, TURNOS), "ab") as archivo:
+            archivo.write(b"\x01\x02\x03")
+        with open(os.path.join(self.directorio, PARTIDAS), "ab") as archivo:
+            archivo.write(b"\x00\x00\x00")
+        corpus = Corpus(self.directorio)
+        self.assertEqual(len(corpus), 2)
+        corpus.agregar(self.registros[2])
+        corpus.cerrar()
+        with Corpus(self.directorio) as corpus:
+            self.assertEqual(len(corpus), 3)
+            self.comprobar_igual(corpus[2], self.registros[2])
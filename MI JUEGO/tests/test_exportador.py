@@ -0,0 +1,124 @@
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from ludo.exportador import (exportar_arrow, exportar_jsonl,
+                             filas_de_archivos, filas_de_registro,
+                             filas_en_vivo, jugar_turno_descrito)
+from ludo.grabadora import CrearRegistro, RegistroDeJuego
+from ludo.juego import Juego, Jugador, Tablero
+from tests.ayudantes import grabar_partida
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class PruebasFilas(unittest.TestCase):
+
+    def setUp(self):
+        self.juego = Juego()
+        for color in ('yellow', 'red'):
+            self.juego.agregar_jugador(Jugador(color))
+        self.jugador = self.juego.ver_siguiente_jugador()
+        self.rival = [jugador for jugador in self.juego.jugadores
+                      if jugador is not self.jugador][0]
+
+    def test_salida_de_la_piscina(self):
+        fila = jugar_turno_descrito(self.juego, 0, 0, 0, 6)
+        inicio = Tablero.INICIO_COLORES[self.jugador.color]
+        self.assertEqual(fila["color"], self.jugador.color)
+        self.assertEqual(fila["ficha"], self.jugador.fichas[0].id)
+        self.assertEqual((fila["desde_comun"], fila["desde_privada"]),
+                         (0, 0))
+        self.assertEqual((fila["hasta_comun"], fila["hasta_privada"]),
+                         (inicio, 0))
+
+    def test_captura(self):
+        ficha = self.jugador.fichas[0]
+        rival = self.rival.fichas[0]
+        self.juego.tablero.colocar_ficha(ficha, (10, 0))
+        self.juego.tablero.colocar_ficha(rival, (13, 0))
+        fila = jugar_turno_descrito(self.juego, 0, 0, 0, 3)
+        self.assertEqual(fila["capturadas"], [rival.id])
+        self.assertTrue(self.juego.tablero.ficha_en_piscina(rival))
+
+    def test_llegada_al_final(self):
+        ficha = self.jugador.fichas[0]
+        fin = Tablero.FIN_COLORES[self.jugador.color]
+        self.juego.tablero.colocar_ficha(ficha, (fin, 5))
+        fila = jugar_turno_descrito(self.juego, 0, 0, 0, 2)
+        self.assertTrue(fila["llego_al_final"])
+        self.assertEqual(fila["hasta_privada"], Tablero.TAMANO_COLOR_TABLERO)
+
+    def test_en_vivo(self):
+        random.seed(0)
+        registro = CrearRegistro()
+        filas = list(filas_en_vivo(self.juego, registro=registro))
+        self.assertTrue(self.juego.terminado)
+        self.assertEqual(sorted(filas[-1]["clasificados"]),
+                         ['red', 'yellow'])
+        self.assertEqual(registro.historial_del_juego,
+                         [(fila["dado"], fila["indice"]) for fila in filas])
+
+
+class PruebasGrabaciones(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.registro = grabar_partida()
+        archivo = io.BytesIO()
+        self.registro.guardar(archivo)
+        archivo.seek(0)
+        self.filas = list(filas_de_registro(RegistroDeJuego(archivo)))
+
+    def tearDown(self):
+        self.carpeta.cleanup()
+
+    def grabar(self, nombre, historial):
+        ruta = os.path.join(self.carpeta.name, nombre)
+        self.registro.historial_del_juego = historial
+        with open(ruta, "wb") as archivo:
+            self.registro.guardar(archivo)
+        return ruta
+
+    def test_reproduce_todos_los_turnos(self):
+        self.assertEqual(len(self.filas),
+                         len(self.registro.historial_del_juego))
+        self.assertEqual([(fila["dado"], fila["indice"])
+                          for fila in self.filas],
+                         self.registro.historial_del_juego)
+
+    def test_grabacion_danada_no_detiene_la_exportacion(self):
+        historial = list(self.registro.historial_del_juego)
+        danado = list(historial)
+        danado[30] = (danado[30][0], 7)
+        rutas = [self.grabar("a.ludo", historial),
+                 self.grabar("b.ludo", danado),
+                 self.grabar("c.ludo", historial)]
+        errores = []
+        filas = list(filas_de_archivos(
+            rutas, lambda *error: errores.append(error[:2])))
+        self.assertEqual(errores, [("b.ludo", 30)])
+        self.assertEqual(len(filas), 2 * len(historial) + 30)
+
+    def test_jsonl_por_lotes(self):
+        ruta = os.path.join(self.carpeta.name, "filas.jsonl")
+        for tamano_lote in (1, 7, len(self.filas), 10000):
+            total = exportar_jsonl(iter(self.filas), ruta, tamano_lote)
+            with open(ruta, encoding="utf-8") as archivo:
+                filas = [json.loads(linea) for linea in archivo]
+            self.assertEqual(total, len(self.filas))
+            self.assertEqual(filas, self.filas)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow no está instalado")
+    def test_arrow(self):
+        ruta = os.path.join(self.carpeta.name, "filas.arrow")
+        total = exportar_arrow(iter(self.filas), ruta, 50)
+        lector = pyarrow.ipc.open_file(ruta)
+        self.assertEqual(total, len(self.filas))
+        self.assertEqual(lector.read_all().to_pylist(), self.filas)
@@ -0,0 +1,54 @@
+import unittest
+
+from ludo.heuristica import CARACTERISTICAS, calcular_caracteristicas
+from ludo.juego import Juego, Jugador
+
+CAPTURA = CARACTERISTICAS.index("captura")
+EXPOSICION = CARACTERISTICAS.index("exposicion")
+
+
+class PruebasHeuristica(unittest.TestCase):
+
+    def setUp(self):
+        self.juego = Juego()
+        self.jugadores = {}
+        for color in ('yellow', 'blue', 'red', 'green'):
+            jugador = Jugador(color)
+            self.jugadores[color] = jugador
+            self.juego.agregar_jugador(jugador)
+        self.tablero = self.juego.tablero
+
+    def colocar(self, color, numero, comun):
+        ficha = self.jugadores[color].fichas[numero]
+        self.tablero.colocar_ficha(ficha, (comun, 0))
+        return ficha
+
+    def caracteristicas(self, ficha, valor_dado):
+        return calcular_caracteristicas(self.tablero, [ficha], valor_dado)[0]
+
+    def test_captura_y_exposicion(self):
+        ficha = self.colocar('yellow', 0, 10)
+        self.colocar('blue', 0, 13)   # en la casilla de llegada
+        self.colocar('blue', 1, 8)    # 5 casillas detrás
+        self.colocar('red', 0, 12)    # 1 casilla detrás
+        self.colocar('green', 0, 5)   # 8 casillas detrás, fuera de alcance
+        caracteristicas = self.caracteristicas(ficha, 3)
+        self.assertEqual(caracteristicas[CAPTURA], 1)
+        self.assertEqual(caracteristicas[EXPOSICION], 2)
+
+    def test_rival_que_entra_a_su_zona_no_amenaza(self):
+        ficha = self.colocar('yellow', 0, 10)
+        # El azul termina su recorrido común en la casilla 14
+        self.colocar('blue', 0, 12)
+        self.assertEqual(self.caracteristicas(ficha, 4)[EXPOSICION], 1)
+        self.assertEqual(self.caracteristicas(ficha, 5)[EXPOSICION], 0)
+
+    def test_exposicion_al_dar_la_vuelta(self):
+        # El verde llega a la casilla 2 dando la vuelta al tablero
+        ficha = self.colocar('green', 0, 54)
+        self.colocar('red', 0, 52)
+        # El amarillo en 54 entra a su zona después de la casilla 56
+        self.colocar('yellow', 0, 54)
+        caracteristicas = self.caracteristicas(ficha, 4)
+        self.assertEqual(caracteristicas[CAPTURA], 0)
+        self.assertEqual(caracteristicas[EXPOSICION], 1)
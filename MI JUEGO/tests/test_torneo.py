@@ -0,0 +1,122 @@
+import math
+import os
+import pickle
+import tempfile
+import unittest
+from collections import Counter
+
+from ludo.estrategias import ESTRATEGIAS
+from ludo.juego import Tablero
+from ludo.torneo import (Calificaciones, _ejecutar_tarea,
+                         cargar_turnos_grabados, generar_asientos)
+from ludo.validador import validar_archivo
+
+ASIENTOS = [('yellow', 'aleatoria'), ('red', 'adelantada')]
+
+
+class PruebasAsientos(unittest.TestCase):
+
+    def comprobar_balance(self, jugadores_por_partida):
+        participantes = sorted(ESTRATEGIAS)
+        colores = Counter()
+        puestos = Counter()
+        for asientos in generar_asientos(participantes,
+                                         jugadores_por_partida):
+            self.assertEqual(len(asientos), jugadores_por_partida)
+            self.assertEqual(len({color for color, _ in asientos}),
+                             jugadores_por_partida)
+            for puesto, (color, nombre) in enumerate(asientos):
+                colores[nombre, color] += 1
+                puestos[nombre, puesto] += 1
+        self.assertEqual(len(colores),
+                         len(participantes) * len(Tablero.ORDEN_COLORES))
+        self.assertEqual(len(set(colores.values())), 1)
+        self.assertEqual(len(puestos),
+                         len(participantes) * jugadores_por_partida)
+        self.assertEqual(len(set(puestos.values())), 1)
+
+    def test_dos_jugadores(self):
+        self.comprobar_balance(2)
+
+    def test_tres_jugadores(self):
+        self.comprobar_balance(3)
+
+    def test_cuatro_jugadores(self):
+        self.comprobar_balance(4)
+
+
+class PruebasCalificaciones(unittest.TestCase):
+
+    def test_ejemplo_de_glickman(self):
+        # Ejemplo del artículo de Glicko: 1500 (RD 200) gana contra
+        # 1400 (RD 30) y pierde contra 1550 (RD 100) y 1700 (RD 300)
+        calificaciones = Calificaciones(variacion=0)
+        calificaciones.valores = {
+            'a': (1500.0, 200.0), 'b': (1400.0, 30.0),
+            'c': (1550.0, 100.0), 'd': (1700.0, 300.0)}
+        calificaciones.actualizar(['d', 'c', 'a', 'b'])
+        calificacion, desviacion = calificaciones.obtener('a')
+        self.assertAlmostEqual(calificacion, 1464.1, places=1)
+        self.assertAlmostEqual(desviacion, 151.4, places=1)
+
+    def test_variacion_aumenta_la_desviacion_hasta_la_inicial(self):
+        calificaciones = Calificaciones(variacion=50)
+        calificaciones.valores = {'a': (1500.0, 100.0),
+                                  'b': (1500.0, 349.0)}
+        self.assertAlmostEqual(calificaciones._inflar('a')[1],
+                               math.sqrt(100 ** 2 + 50 ** 2))
+        self.assertEqual(calificaciones._inflar('b')[1],
+                         Calificaciones.DESVIACION_INICIAL)
+        self.assertEqual(calificaciones._inflar('nuevo')[1],
+                         Calificaciones.DESVIACION_INICIAL)
+
+
+class PruebasReanudar(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.carpeta.name, "partida_000000.ludo")
+        self.tarea = (self.ruta, ASIENTOS, "0-0", ESTRATEGIAS)
+        self.clasificacion = _ejecutar_tarea(self.tarea)
+        with open(self.ruta, "rb") as archivo:
+            self.contenido = archivo.read()
+        self.jugadores, self.historial = pickle.loads(self.contenido)
+
+    def tearDown(self):
+        self.carpeta.cleanup()
+
+    def grabar(self, historial):
+        with open(self.ruta, "wb") as archivo:
+            pickle.dump([self.jugadores, historial], archivo)
+
+    def leer_historial(self):
+        with open(self.ruta, "rb") as archivo:
+            return pickle.load(archivo)[1]
+
+    def test_otros_jugadores(self):
+        with self.assertRaises(ValueError):
+            cargar_turnos_grabados(self.ruta, list(reversed(ASIENTOS)))
+
+    def comprobar_terminada(self, turnos_conservados):
+        clasificacion = _ejecutar_tarea(self.tarea)
+        self.assertEqual(sorted(clasificacion), sorted(self.clasificacion))
+        historial = self.leer_historial()
+        self.assertEqual(historial[:turnos_conservados],
+                         self.historial[:turnos_conservados])
+        self.assertIsNone(validar_archivo(self.ruta).error)
+
+    def test_grabacion_recortada(self):
+        self.grabar(self.historial[:40])
+        self.comprobar_terminada(40)
+
+    def test_grabacion_danada(self):
+        historial = list(self.historial)
+        historial[30] = (9, 9)
+        self.grabar(historial)
+        self.comprobar_terminada(30)
+
+    def test_grabacion_borrada_se_repite_igual(self):
+        os.remove(self.ruta)
+        self.assertEqual(_ejecutar_tarea(self.tarea), self.clasificacion)
+        with open(self.ruta, "rb") as archivo:
+            self.assertEqual(archivo.read(), self.contenido)
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+from ludo.corpus import Corpus
+from ludo.grabadora import RegistroDeJuego
+from ludo.validador import validar_archivo, validar_archivos, validar_corpus
+from tests.ayudantes import grabar_partida
+
+
+class PruebasValidador(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.registro = grabar_partida()
+        self.historial = list(self.registro.historial_del_juego)
+        # Primer turno en que hay más de una ficha para mover
+        self.turno_con_opciones = next(
+            turno for turno, (_, indice) in enumerate(self.historial)
+            if indice > 0)
+
+    def tearDown(self):
+        self.carpeta.cleanup()
+
+    def grabar(self, historial, nombre="partida.ludo"):
+        ruta = os.path.join(self.carpeta.name, nombre)
+        self.registro.historial_del_juego = historial
+        with open(ruta, "wb") as archivo:
+            self.registro.guardar(archivo)
+        return ruta
+
+    def comprobar_error(self, historial, turno):
+        ruta = self.grabar(historial)
+        resultado = validar_archivo(ruta)
+        self.assertEqual(resultado.turno, turno)
+        self.assertIsNotNone(resultado.error)
+        resultado = validar_archivo(ruta, reparar=True)
+        self.assertTrue(resultado.reparado)
+        with open(ruta, "rb") as archivo:
+            self.assertEqual(RegistroDeJuego(archivo).historial_del_juego,
+                             self.historial[:turno])
+        self.assertIsNone(validar_archivo(ruta).error)
+
+    def test_partida_valida(self):
+        resultado = validar_archivo(self.grabar(self.historial))
+        self.assertIsNone(resultado.error)
+        self.assertEqual(resultado.turnos_validos, len(self.historial))
+
+    def test_dado_fuera_de_rango(self):
+        historial = list(self.historial)
+        historial[10] = (7, historial[10][1])
+        self.comprobar_error(historial, 10)
+
+    def test_indice_fuera_de_rango(self):
+        historial = list(self.historial)
+        turno = self.turno_con_opciones
+        historial[turno] = (historial[turno][0], 4)
+        self.comprobar_error(historial, turno)
+
+    def test_turno_despues_del_final(self):
+        self.comprobar_error(self.historial + [(3, -1)], len(self.historial))
+
+    def test_validar_archivos_en_paralelo(self):
+        rutas = [self.grabar(self.historial, "buena.ludo"),
+                 self.grabar(self.historial + [(3, -1)], "mala.ludo")]
+        resultados = {os.path.basename(resultado.ruta): resultado
+                      for resultado in validar_archivos(rutas, procesos=2)}
+        self.assertIsNone(resultados["buena.ludo"].error)
+        self.assertEqual(resultados["mala.ludo"].turno, len(self.historial))
+
+    def test_validar_corpus(self):
+        directorio = os.path.join(self.carpeta.name, "corpus")
+        danado = list(self.historial)
+        danado[10] = (0, danado[10][1])
+        with Corpus.crear(directorio) as corpus:
+            for historial in (self.historial, danado):
+                self.registro.historial_del_juego = historial
+                corpus.agregar(self.registro)
+        resultados = sorted(validar_corpus(directorio, procesos=2))
+        self.assertEqual([resultado.ruta for resultado in resultados],
+                         [directorio + ":0", directorio + ":1"])
+        self.assertIsNone(resultados[0].error)
+        self.assertEqual(resultados[1].turno, 10)
+        self.assertFalse(resultados[1].reparado)